@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from kura.summarisation import ConversationSummary
-from kura.types import Cluster
+from kura.types import Cluster, ConversationSummary
 
 
 class BaseClusterModel(ABC):
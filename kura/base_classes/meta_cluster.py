@@ -3,6 +3,9 @@ from kura.types.cluster import Cluster
 
 
 class BaseMetaClusterModel(ABC):
+    # Kura keeps reducing until there are at most this many root clusters
+    max_clusters: int
+
     @property
     @abstractmethod
     def checkpoint_filename(self) -> str:
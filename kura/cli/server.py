@@ -13,12 +13,6 @@ api.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-# Serve static files from web/dist
-web_dir = Path(__file__).parent.parent / "static" / "dist"
-if not web_dir.exists():
-    raise FileNotFoundError(f"Static files directory not found: {web_dir}")
-
-
 # Serve static files from web/dist at the root
 web_dir = Path(__file__).parent.parent / "static" / "dist"
 if not web_dir.exists():
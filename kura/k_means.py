@@ -30,11 +30,14 @@ class KmeansClusteringMethod(BaseClusteringMethod):
         data: list[T] = [item["item"] for item in items]  # pyright: ignore
         n_clusters = math.ceil(len(data) / self.clusters_per_group)
 
-        X = np.array(embeddings)
+        # sklearn's KMeans runs natively on float32, which halves the memory traffic of the float64 default
+        X = np.asarray(embeddings, dtype=np.float32)
         kmeans = KMeans(n_clusters=n_clusters)
         cluster_labels = kmeans.fit_predict(X)
 
-        return {
-            i: [data[j] for j in range(len(data)) if cluster_labels[j] == i]
-            for i in range(n_clusters)
-        }
+        # Bucket items in one pass over the labels instead of rescanning them per cluster
+        groups: dict[int, list[T]] = {i: [] for i in range(n_clusters)}
+        for item, label in zip(data, cluster_labels.tolist()):
+            groups[label].append(item)
+
+        return groups
@@ -5,7 +5,6 @@ from kura.summarisation import SummaryModel
 from kura.meta_cluster import MetaClusterModel
 from kura.cluster import ClusterModel
 from kura.visualization import ClusterVisualizer
-import shutil
 from kura.base_classes import (
     BaseEmbeddingModel,
     BaseSummaryModel,
@@ -14,8 +13,11 @@ from kura.base_classes import (
     BaseDimensionalityReduction,
 )
 from typing import Union, Optional, TypeVar
+from functools import lru_cache
+import asyncio
+import io
 import os
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from kura.types.dimensionality import ProjectedCluster
 from kura.types import ConversationSummary
 
@@ -30,6 +32,12 @@ except ImportError:
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _checkpoint_adapter(response_model: type[T]) -> TypeAdapter[T]:
+    """Return a TypeAdapter for a checkpoint model, built once per model class."""
+    return TypeAdapter(response_model)
+
+
 class Kura:
     """Main class for the Kura conversation analysis pipeline.
     
@@ -123,15 +131,14 @@ class Kura:
         # Define Checkpoints
         self.checkpoint_dir = checkpoint_dir
         
-        # Helper to construct checkpoint paths
-        def _checkpoint_path(filename: str) -> str:
-            return os.path.join(self.checkpoint_dir, filename)
-        
-        self.conversation_checkpoint_name = _checkpoint_path(conversation_checkpoint_name)
+        self.conversation_checkpoint_name = os.path.join(
+            self.checkpoint_dir, conversation_checkpoint_name
+        )
         self.disable_checkpoints = disable_checkpoints
         
         # Initialize visualizer
         self._visualizer = None
+        self._last_meta_clusters: Optional[list[Cluster]] = None
 
     @property
     def summary_checkpoint_path(self) -> str:
@@ -165,14 +172,16 @@ class Kura:
         Returns:
             List of model instances if checkpoint exists, None otherwise
         """
-        if not self.disable_checkpoints:
-            if os.path.exists(checkpoint_path):
-                print(
-                    f"Loading checkpoint from {checkpoint_path} for {response_model.__name__}"
-                )
-                with open(checkpoint_path, "r") as f:
-                    return [response_model.model_validate_json(line) for line in f]
-        return None
+        if self.disable_checkpoints:
+            return None
+
+        try:
+            with open(checkpoint_path, "rb") as f:
+                print(f"Loading checkpoint from {checkpoint_path} for {response_model.__name__}")
+                validate_line = _checkpoint_adapter(response_model).validate_json
+                return [validate_line(line) for line in f]
+        except FileNotFoundError:
+            return None
 
     def save_checkpoint(self, checkpoint_path: str, data: list[T]) -> None:
         """Save data to a checkpoint file.
@@ -182,21 +191,23 @@ class Kura:
             data: List of model instances to save
         """
         if not self.disable_checkpoints:
-            with open(checkpoint_path, "w") as f:
-                for item in data:
-                    f.write(item.model_dump_json() + "\n")
+            buffer = io.BytesIO()
+            for item in data:
+                buffer.write(_checkpoint_adapter(type(item)).dump_json(item))
+                buffer.write(b"\n")
+
+            with open(checkpoint_path, "wb") as f:
+                f.write(buffer.getbuffer())
 
     def setup_checkpoint_dir(self):
         """Set up the checkpoint directory.
         
         Creates the checkpoint directory if it doesn't exist.
-        If override_checkpoint_dir is True, removes and recreates the directory.
         """
         if self.disable_checkpoints:
             return
 
-        if not os.path.exists(self.checkpoint_dir):
-            os.makedirs(self.checkpoint_dir)
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
 
     async def reduce_clusters(self, clusters: list[Cluster]) -> list[Cluster]:
         """Reduce clusters into a hierarchical structure.
@@ -210,14 +221,27 @@ class Kura:
         Returns:
             List of clusters with hierarchical structure
         """
-        checkpoint_items = self.load_checkpoint(
-            self.meta_cluster_checkpoint_path, Cluster
+        checkpoint_items = await asyncio.to_thread(
+            self.load_checkpoint, self.meta_cluster_checkpoint_path, Cluster
         )
         if checkpoint_items:
+            self._last_meta_clusters = checkpoint_items
             return checkpoint_items
 
+        # Nothing to reduce, so skip building the id index and go straight to saving
+        if len(clusters) <= self.meta_cluster_model.max_clusters:
+            await asyncio.to_thread(
+                self.save_checkpoint, self.meta_cluster_checkpoint_path, clusters
+            )
+            self._last_meta_clusters = clusters
+            return clusters
+
         root_clusters = clusters
 
+        # Re-parented clusters come back with their original ids, so updating by id
+        # replaces outdated versions in place and appends the new meta clusters
+        clusters_by_id = {c.id: c for c in clusters}
+
         print(f"Starting with {len(root_clusters)} clusters")
 
         while len(root_clusters) > self.meta_cluster_model.max_clusters:
@@ -226,19 +250,24 @@ class Kura:
                 root_clusters
             )
 
-            # These are the new root clusters that we've generated
-            root_clusters = [c for c in new_current_level if c.parent_id is None]
-
-            # We then remove outdated versions of clusters
-            old_cluster_ids = {rc.id for rc in new_current_level if rc.parent_id}
-            clusters = [c for c in clusters if c.id not in old_cluster_ids]
+            # Pick out the new root clusters and index every cluster in one pass
+            root_clusters = []
+            for c in new_current_level:
+                if c.parent_id is None:
+                    root_clusters.append(c)
+                clusters_by_id[c.id] = c
 
-            # We then add the new clusters to the list
-            clusters.extend(new_current_level)
+            # The index and root_clusters hold everything we still need from this level
+            del new_current_level
 
             print(f"Reduced to {len(root_clusters)} clusters")
 
-        self.save_checkpoint(self.meta_cluster_checkpoint_path, clusters)
+        clusters = list(clusters_by_id.values())
+
+        await asyncio.to_thread(
+            self.save_checkpoint, self.meta_cluster_checkpoint_path, clusters
+        )
+        self._last_meta_clusters = clusters
         return clusters
 
     async def summarise_conversations(
@@ -255,14 +284,16 @@ class Kura:
         Returns:
             List of conversation summaries
         """
-        checkpoint_items = self.load_checkpoint(
-            self.summary_checkpoint_path, ConversationSummary
+        checkpoint_items = await asyncio.to_thread(
+            self.load_checkpoint, self.summary_checkpoint_path, ConversationSummary
         )
         if checkpoint_items:
             return checkpoint_items
 
         summaries = await self.summarisation_model.summarise(conversations)
-        self.save_checkpoint(self.summary_checkpoint_path, summaries)
+        await asyncio.to_thread(
+            self.save_checkpoint, self.summary_checkpoint_path, summaries
+        )
         return summaries
 
     async def generate_base_clusters(self, summaries: list[ConversationSummary]) -> list[Cluster]:
@@ -277,14 +308,16 @@ class Kura:
         Returns:
             List of base clusters
         """
-        checkpoint_items = self.load_checkpoint(
-            self.cluster_checkpoint_path, Cluster
+        checkpoint_items = await asyncio.to_thread(
+            self.load_checkpoint, self.cluster_checkpoint_path, Cluster
         )
         if checkpoint_items:
             return checkpoint_items
 
         clusters: list[Cluster] = await self.cluster_model.cluster_summaries(summaries)
-        self.save_checkpoint(self.cluster_checkpoint_path, clusters)
+        await asyncio.to_thread(
+            self.save_checkpoint, self.cluster_checkpoint_path, clusters
+        )
         return clusters
 
     async def reduce_dimensionality(
@@ -301,8 +334,8 @@ class Kura:
         Returns:
             List of projected clusters with 2D coordinates
         """
-        checkpoint_items = self.load_checkpoint(
-            self.dimensionality_checkpoint_path, ProjectedCluster
+        checkpoint_items = await asyncio.to_thread(
+            self.load_checkpoint, self.dimensionality_checkpoint_path, ProjectedCluster
         )
         if checkpoint_items:
             return checkpoint_items
@@ -311,8 +344,10 @@ class Kura:
             await self.dimensionality_reduction.reduce_dimensionality(clusters)
         )
 
-        self.save_checkpoint(
-            self.dimensionality_checkpoint_path, dimensionality_reduced_clusters
+        await asyncio.to_thread(
+            self.save_checkpoint,
+            self.dimensionality_checkpoint_path,
+            dimensionality_reduced_clusters,
         )
         return dimensionality_reduced_clusters
 
@@ -341,9 +376,12 @@ class Kura:
                 conversations, self.conversation_checkpoint_name
             )
 
+        # Drop each stage's input once it is consumed so earlier stages can be freed
         summaries = await self.summarise_conversations(conversations)
         clusters: list[Cluster] = await self.generate_base_clusters(summaries)
+        del summaries
         processed_clusters: list[Cluster] = await self.reduce_clusters(clusters)
+        del clusters
         dimensionality_reduced_clusters = await self.reduce_dimensionality(
             processed_clusters
         )
@@ -357,23 +395,29 @@ class Kura:
             self._visualizer = ClusterVisualizer(self)
         return self._visualizer
 
-    def visualise_clusters(self):
+    def visualise_clusters(self, clusters: Optional[list[Cluster]] = None):
         """Print a hierarchical visualization of clusters to the terminal.
         
-        Delegates to the ClusterVisualizer for the actual visualization.
+        Delegates to the ClusterVisualizer for the actual visualization. Uses the
+        given clusters, else the meta-clusters from the last run, else the
+        meta-cluster checkpoint file.
         """
-        self.visualizer.visualise_clusters()
+        self.visualizer.visualise_clusters(clusters)
     
-    def visualise_clusters_enhanced(self):
+    def visualise_clusters_enhanced(self, clusters: Optional[list[Cluster]] = None):
         """Print an enhanced hierarchical visualization of clusters.
         
-        Delegates to the ClusterVisualizer for the actual visualization.
+        Delegates to the ClusterVisualizer for the actual visualization. Uses the
+        given clusters, else the meta-clusters from the last run, else the
+        meta-cluster checkpoint file.
         """
-        self.visualizer.visualise_clusters_enhanced()
+        self.visualizer.visualise_clusters_enhanced(clusters)
     
-    def visualise_clusters_rich(self):
+    def visualise_clusters_rich(self, clusters: Optional[list[Cluster]] = None):
         """Print a rich-formatted hierarchical visualization using Rich library.
         
-        Delegates to the ClusterVisualizer for the actual visualization.
+        Delegates to the ClusterVisualizer for the actual visualization. Uses the
+        given clusters, else the meta-clusters from the last run, else the
+        meta-cluster checkpoint file.
         """
-        self.visualizer.visualise_clusters_rich()
\ No newline at end of file
+        self.visualizer.visualise_clusters_rich(clusters)
\ No newline at end of file
@@ -10,7 +10,7 @@ import instructor
 from asyncio import Semaphore
 from pydantic import BaseModel, field_validator, ValidationInfo
 import re
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
 import asyncio
 from typing import Optional
 
@@ -46,10 +46,11 @@ class ClusterLabel(BaseModel):
             return v
 
         # Fuzzy match check with 90% similarity threshold
-        for candidate in candidate_clusters:
-            similarity = fuzz.ratio(v, candidate)
-            if similarity >= 90:  # 90% similarity threshold
-                return candidate
+        match = process.extractOne(
+            v, candidate_clusters, scorer=fuzz.ratio, score_cutoff=90
+        )
+        if match is not None:
+            return match[0]
 
         # If no match found
         raise ValueError(
@@ -94,7 +95,6 @@ class MetaClusterModel(BaseMetaClusterModel):
         self.embedding_model = embedding_model
         self.clustering_model = clustering_model
         self.model = model
-        self.console = console
         
         # Debug: Check if console is set
         if self.console:
@@ -424,10 +424,18 @@ Based on this information, determine the most appropriate higher-level cluster a
                         # Step 2: Label clusters with progress
                         label_task_id = progress.add_task("[cyan]Labeling clusters...", total=len(clusters))
                         cluster_labels = []
-                        for i, cluster in enumerate(clusters):
-                            result = await self.label_cluster(cluster, candidate_labels)
-                            cluster_labels.append(result)
-                            progress.update(label_task_id, completed=i + 1)
+                        label_tasks = [
+                            asyncio.ensure_future(self.label_cluster(cluster, candidate_labels))
+                            for cluster in clusters
+                        ]
+                        try:
+                            for i, task in enumerate(asyncio.as_completed(label_tasks)):
+                                cluster_labels.append(await task)
+                                progress.update(label_task_id, completed=i + 1)
+                        finally:
+                            # Stop the remaining requests if one of them fails
+                            for task in label_tasks:
+                                task.cancel()
                         
                         # Group clusters by label
                         label_to_clusters = {}
@@ -439,34 +447,41 @@ Based on this information, determine the most appropriate higher-level cluster a
                         # Step 3: Rename cluster groups with progress and preview
                         rename_task_id = progress.add_task("[cyan]Renaming cluster groups...", total=len(label_to_clusters))
                         new_clusters = []
-                        for i, cluster_group in enumerate(label_to_clusters.values()):
-                            result = await self.rename_cluster_group(cluster_group)
-                            new_clusters.append(result)
-                            progress.update(rename_task_id, completed=i + 1)
+                        rename_tasks = [
+                            asyncio.ensure_future(self.rename_cluster_group(cluster_group))
+                            for cluster_group in label_to_clusters.values()
+                        ]
+                        try:
+                            for i, task in enumerate(asyncio.as_completed(rename_tasks)):
+                                result = await task
+                                new_clusters.append(result)
+                                progress.update(rename_task_id, completed=i + 1)
                             
-                            # Update preview with new meta clusters
-                            for cluster_list in result:
-                                for cluster in cluster_list:
-                                    if hasattr(cluster, 'name') and hasattr(cluster, 'description') and cluster.parent_id is None:
+                                # Update preview with new meta clusters
+                                for cluster in result:
+                                    if cluster.parent_id is None:
                                         preview_buffer.append(cluster)
                                         if len(preview_buffer) > max_preview_items:
                                             preview_buffer.pop(0)
                             
-                            # Update preview display
-                            if preview_buffer:
-                                preview_text = Text()
-                                for j, cluster in enumerate(preview_buffer):
-                                    preview_text.append("Meta Cluster: ", style="bold magenta")
-                                    preview_text.append(f"{cluster.name[:80]}...\n", style="bold white")
-                                    preview_text.append("Description: ", style="bold cyan")
-                                    preview_text.append(f"{cluster.description[:100]}...\n\n", style="dim white")
+                                # Update preview display
+                                if preview_buffer:
+                                    preview_text = Text()
+                                    for j, cluster in enumerate(preview_buffer):
+                                        preview_text.append("Meta Cluster: ", style="bold magenta")
+                                        preview_text.append(f"{cluster.name[:80]}...\n", style="bold white")
+                                        preview_text.append("Description: ", style="bold cyan")
+                                        preview_text.append(f"{cluster.description[:100]}...\n\n", style="dim white")
                                 
-                                layout["preview"].update(Panel(
-                                    preview_text,
-                                    title=f"[magenta]Recent Meta Clusters ({len(preview_buffer)}/{max_preview_items})",
-                                    border_style="magenta"
-                                ))
-                        
+                                    layout["preview"].update(Panel(
+                                        preview_text,
+                                        title=f"[magenta]Recent Meta Clusters ({len(preview_buffer)}/{max_preview_items})",
+                                        border_style="magenta"
+                                    ))
+                        finally:
+                            for task in rename_tasks:
+                                task.cancel()
+
                         # Flatten results
                         res = []
                         for new_cluster in new_clusters:
@@ -534,8 +549,10 @@ Based on this information, determine the most appropriate higher-level cluster a
                 chat_ids=clusters[0].chat_ids,
                 parent_id=None,
             )
-            clusters[0].parent_id = new_cluster.id
-            return [new_cluster, clusters[0]]
+            return [
+                new_cluster,
+                clusters[0].model_copy(update={"parent_id": new_cluster.id}),
+            ]
 
         self.sem = Semaphore(self.max_concurrent_requests)
         cluster_embeddings: list[list[float]] = await self._gather_with_progress(
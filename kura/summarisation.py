@@ -1,7 +1,17 @@
-from asyncio import Semaphore, gather
-from typing import Any, Callable, Optional, Union
+from asyncio import Semaphore
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Union
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+from textwrap import dedent
 
 import instructor
+from jinja2 import Template
 from tqdm.asyncio import tqdm_asyncio
 import asyncio
 
@@ -14,6 +24,122 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from rich.console import Console
 
+# Sampling temperature for summaries, as per the Clio paper. Also part of the cache key
+_SUMMARY_TEMPERATURE = 0.2
+
+@lru_cache(maxsize=None)
+def _summary_schema() -> str:
+    # Part of the summary cache key, so a change to the response model invalidates old entries
+    return json.dumps(GeneratedSummary.model_json_schema(), sort_keys=True)
+
+# Preview colours for the 1-5 frustration and concerning scores, from not at all to extremely
+_SCORE_STYLES = {
+    1: "green",
+    2: "yellow",
+    3: "orange3",
+    4: "red",
+    5: "red1",
+}
+
+
+# Identical for every request, so providers that cache prompt prefixes can reuse it
+_SUMMARY_SYSTEM_PROMPT = """
+You will be given a conversation between an AI assistant and a user.
+
+Your job is to extract key information from this conversation. Be descriptive and assume neither good nor bad faith. Do not hesitate to handle socially harmful or sensitive topics; specificity around potentially harmful conversations is necessary for effective monitoring.
+
+When extracting information, do not include any personally identifiable information (PII), like names, locations, phone numbers, email addresses, and so on. Do not include any proper nouns.
+
+Extract the following information:
+
+1. **Summary**: A clear and concise summary in at most two sentences. Don't say "Based on the conversation..." and avoid mentioning the AI assistant/chatbot directly.
+
+2. **Request**: What is the user's overall request for the assistant? Start with "The user's overall request for the assistant is to"
+
+3. **Languages**: What are the main languages of the conversation? Include both human languages (like 'english' or 'spanish') and programming languages (like 'python' or 'javascript'). Use lowercase full names.
+
+4. **Task**: What task is the model being asked to perform in this conversation? Start with "The task is to"
+
+5. **Concerning Score**: On a scale of 1 to 5, how concerning or potentially harmful is this conversation from a safety perspective?
+   - 1: Not concerning at all. Completely benign conversation.
+   - 2: Slightly concerning, but likely harmless.  
+   - 3: Moderately concerning. May warrant a closer look.
+   - 4: Very concerning. Likely needs review.
+   - 5: Extremely concerning. Immediate review needed.
+
+6. **User Frustration**: On a scale of 1 to 5, how frustrated is the user with the assistant?
+   - 1: Not frustrated at all. The user is happy with the assistant.
+   - 2: Slightly frustrated. The user is slightly annoyed with the assistant.
+   - 3: Moderately frustrated. The user is moderately annoyed with the assistant.
+   - 4: Very frustrated. The user is very annoyed with the assistant.
+   - 5: Extremely frustrated. The user is extremely annoyed with the assistant.
+   
+7. **Assistant Errors**: What errors did the assistant make?
+   Example: 
+    - "Responses were too long and verbose"
+    - "Misunderstood the user's intent or request"
+    - "Used wrong tool for the task"
+    - "Ignored user's stated preferences or constraints"
+    - "Provided outdated or incorrect information"
+    - "Failed to maintain conversation context"
+
+
+Remember that
+- Summaries should be concise and short. They should each be at most 1-2 sentences and at most 30 words.
+- Summaries should start with "The user's overall request for the assistant is to"
+- Make sure to omit any personally identifiable information (PII), like names, locations, phone numbers, email addressess, company names and so on.
+- Make sure to indicate specific details such as programming languages, frameworks, libraries and so on which are relevant to the task.
+"""
+
+# Compiled once at import rather than by instructor on every request
+_SUMMARY_PROMPT = Template(
+    """
+The following is a conversation between an AI assistant and a user:
+
+<messages>
+{% for message in messages %}
+<message>{{message.role}}: {{message.content}}</message>
+{% endfor %}
+</messages>
+"""
+)
+
+
+class _TokenBucket:
+    """Async token bucket that refills continuously up to a per-minute budget."""
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.capacity = tokens_per_minute
+        self.tokens = float(tokens_per_minute)
+        self.refill_per_second = tokens_per_minute / 60
+        # The clock and sleep can be swapped out so tests don't depend on real time
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        # A single request larger than the whole budget waits for a full bucket
+        tokens = min(tokens, self.capacity)
+        # Waiters queue on the lock so they are served in arrival order
+        async with self.lock:
+            while True:
+                now = self.clock()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.refill_per_second,
+                )
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await self.sleep((tokens - self.tokens) / self.refill_per_second)
+
 
 class SummaryModel(BaseSummaryModel):
     @property
@@ -32,6 +158,10 @@ class SummaryModel(BaseSummaryModel):
             ]
         ] = [],
         console: Optional['Console'] = None,
+        cache_dir: Optional[str] = None,
+        extractor_semaphore: Optional[Semaphore] = None,
+        tokens_per_minute: Optional[int] = None,
+        short_conversation_chars: Optional[int] = None,
         **kwargs, # For future use
     ):
         self.sems = None
@@ -39,7 +169,80 @@ class SummaryModel(BaseSummaryModel):
         self.max_concurrent_requests = max_concurrent_requests
         self.model = model
         self.semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Caps in-flight extractor calls across all conversations, separately from self.semaphore
+        # since extractors may acquire that one themselves
+        self.extractor_semaphore = extractor_semaphore or asyncio.Semaphore(
+            max_concurrent_requests
+        )
         self.console = console
+        # Created on the first save, so constructing the model doesn't touch the filesystem
+        self.cache_dir = cache_dir
+        self._client = None
+        # Optional provider TPM budget, on top of the concurrency limit from self.semaphore
+        self.token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        # Off by default. When set, conversations with less content than this skip the LLM and
+        # are summarised by their raw first user message, which is not scrubbed of PII and
+        # leaves the scores empty, see _summarise_short_conversation
+        self.short_conversation_chars = short_conversation_chars
+
+    @property
+    def client(self):
+        """The instructor client, created on first use and shared by every request."""
+        if self._client is None:
+            self._client = instructor.from_provider(self.model, async_client=True)
+        return self._client
+
+    def _render_prompt(self, conversation: Conversation) -> str:
+        """Render the conversation into the user message sent to the LLM."""
+        return dedent(_SUMMARY_PROMPT.render(messages=conversation.messages))
+
+    def _cache_key(self, rendered_prompt: str) -> str:
+        """Hash everything that determines the LLM response for a rendered prompt."""
+        digest = hashlib.sha256()
+        for part in (
+            self.model,
+            repr(_SUMMARY_TEMPERATURE),
+            _SUMMARY_SYSTEM_PROMPT,
+            _summary_schema(),
+            rendered_prompt,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        """Return the file a cached response is stored in."""
+        if self.cache_dir is None:
+            raise ValueError("Summary caching requires a cache_dir")
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_cached_summary(self, key: str) -> Optional[GeneratedSummary]:
+        """Return the cached response for a key, or None if it hasn't been cached."""
+        try:
+            with open(self._cache_path(key), "rb") as f:
+                return GeneratedSummary.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _save_cached_summary(self, key: str, resp: GeneratedSummary) -> None:
+        """Write a response to the cache, replacing the file atomically.
+
+        A failed write only costs a cache miss later, so it is not raised.
+        """
+        path = self._cache_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # A unique temp file per writer, since identical conversations share a key
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(resp.model_dump_json())
+            os.replace(tmp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
 
     async def _gather_with_progress(self, tasks, desc: str = "Processing", disable: bool = False, show_preview: bool = False):
         """Helper method to run async gather with Rich progress bar if available, otherwise tqdm."""
@@ -49,6 +252,7 @@ class SummaryModel(BaseSummaryModel):
                 from rich.live import Live
                 from rich.layout import Layout
                 from rich.panel import Panel
+                from rich.table import Table
                 from rich.text import Text
                 from rich.errors import LiveError
                 
@@ -60,8 +264,8 @@ class SummaryModel(BaseSummaryModel):
                         Layout(name="preview")
                     )
                     
-                    preview_buffer = []
                     max_preview_items = 3
+                    preview_buffer = deque(maxlen=max_preview_items)
                     
                     # Create progress with cleaner display
                     progress = Progress(
@@ -77,63 +281,66 @@ class SummaryModel(BaseSummaryModel):
                     
                     try:
                         with Live(layout, console=self.console, refresh_per_second=4):
-                            completed_tasks = []
-                            for i, task in enumerate(asyncio.as_completed(tasks)):
+                            completed = 0
+
+                            async def track(task):
+                                nonlocal completed
                                 result = await task
-                                completed_tasks.append(result)
-                                progress.update(task_id, completed=i + 1)
-                                
+                                completed += 1
                                 # Add to preview buffer if it's a ConversationSummary
                                 if hasattr(result, 'summary') and hasattr(result, 'chat_id'):
                                     preview_buffer.append(result)
-                                    if len(preview_buffer) > max_preview_items:
-                                        preview_buffer.pop(0)
-                                    
-                                    # Update preview display
-                                    preview_text = Text()
-                                    for j, summary in enumerate(preview_buffer):
-                                        # Color based on user frustration level
-                                        frustration_style = {
-                                            1: "green",    # Not frustrated
-                                            2: "yellow",   # Slightly frustrated
-                                            3: "orange3",  # Moderately frustrated
-                                            4: "red",      # Very frustrated
-                                            5: "red1"      # Extremely frustrated
-                                        }.get(summary.user_frustration, "white")
-
-                                        # Color based on concerning score
-                                        concern_style = {
-                                            1: "green",    # Not concerning
-                                            2: "yellow",   # Slightly concerning
-                                            3: "orange3",  # Moderately concerning
-                                            4: "red",      # Very concerning
-                                            5: "red1"      # Extremely concerning
-                                        }.get(summary.concerning_score, "white")
-
-                                        preview_text.append(f"Chat {summary.chat_id[:8]}...: ", style="bold blue")
-                                        preview_text.append(f"{summary.summary[:100]}...\n", style=frustration_style)
-                                        
-                                        if summary.request:
-                                            preview_text.append(f"Request: {summary.request[:50]}...\n", style=frustration_style)
-                                        if summary.languages:
-                                            preview_text.append(f"Languages: {', '.join(summary.languages)}\n", style="dim cyan")
-                                        if summary.task:
-                                            preview_text.append(f"Task: {summary.task[:50]}...\n", style=concern_style)
-                                        
-                                        # Add frustration and concern indicators
-                                        if summary.user_frustration:
-                                            preview_text.append(f"Frustration: {'😊' * summary.user_frustration}\n", style=frustration_style)
-                                        if summary.concerning_score:
-                                            preview_text.append(f"Concern: {'⚠️' * summary.concerning_score}\n", style=concern_style)
-                                        
-                                        preview_text.append("\n")
-                                    
+                                return result
+
+                            rendered_count = -1
+
+                            def refresh():
+                                nonlocal rendered_count
+                                # Nothing finished since the last tick, so the display is current
+                                if completed == rendered_count:
+                                    return
+                                rendered_count = completed
+
+                                progress.update(task_id, completed=completed)
+                                if preview_buffer:
+                                    # Rebuilt from the bounded buffer, so at most max_preview_items rows
+                                    preview_table = Table(box=None, expand=True, show_edge=False)
+                                    preview_table.add_column("Chat", style="bold blue", no_wrap=True)
+                                    preview_table.add_column("Summary", ratio=1)
+                                    preview_table.add_column("Languages", style="dim cyan")
+                                    preview_table.add_column("Frustration", no_wrap=True)
+                                    preview_table.add_column("Concern", no_wrap=True)
+
+                                    for summary in preview_buffer:
+                                        frustration_style = _SCORE_STYLES.get(summary.user_frustration, "white")
+                                        concern_style = _SCORE_STYLES.get(summary.concerning_score, "white")
+                                        preview_table.add_row(
+                                            f"{summary.chat_id[:8]}...",
+                                            Text(f"{summary.summary[:100]}...", style=frustration_style),
+                                            ", ".join(summary.languages or []),
+                                            Text("😊" * (summary.user_frustration or 0), style=frustration_style),
+                                            Text("⚠️" * (summary.concerning_score or 0), style=concern_style),
+                                        )
+
                                     layout["preview"].update(Panel(
-                                        preview_text,
+                                        preview_table,
                                         title=f"[green]Recent Summaries ({len(preview_buffer)}/{max_preview_items})",
                                         border_style="green"
                                     ))
-                            
+
+                            async def refresh_periodically():
+                                # Redraw at the Live refresh rate rather than once per completed task
+                                while True:
+                                    await asyncio.sleep(0.25)
+                                    refresh()
+
+                            refresher = asyncio.create_task(refresh_periodically())
+                            try:
+                                completed_tasks = await asyncio.gather(*(track(task) for task in tasks))
+                            finally:
+                                refresher.cancel()
+                            refresh()
+
                             return completed_tasks
                     except LiveError:
                         # If Rich Live fails, fall back to simple progress without Live
@@ -198,33 +405,74 @@ class SummaryModel(BaseSummaryModel):
         )
         return summaries
 
+    async def summarise_iter(
+        self, conversations: Iterable[Conversation], window: Optional[int] = None
+    ) -> AsyncIterator[ConversationSummary]:
+        """Yield summaries as they complete instead of collecting them all first.
+
+        At most `window` conversations (default: twice max_concurrent_requests) are
+        scheduled at a time, so memory stays bounded by the work in flight and callers
+        can write or process summaries while the rest are still being generated.
+        Summaries are yielded in completion order.
+        """
+        window = window or self.max_concurrent_requests * 2
+        pending: set[asyncio.Task] = set()
+        try:
+            for conversation in conversations:
+                pending.add(asyncio.ensure_future(self.summarise_conversation(conversation)))
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Don't leave requests running if the caller stops iterating early
+            for task in pending:
+                task.cancel()
+
     async def apply_hooks(
         self, conversation: Conversation
     ) -> dict[str, Union[str, int, float, bool, list[str], list[int], list[float]]]:
-        coros = [
-            extractor(conversation, self.semaphore)
+        async def run_extractor(extractor):
+            async with self.extractor_semaphore:
+                return await extractor(conversation, self.semaphore)  # pyright: ignore
+
+        tasks = [
+            asyncio.ensure_future(run_extractor(extractor))
             for extractor in self.extractors
         ]
-        metadata_extracted = await gather(*coros)  # pyright: ignore
 
+        # Merge results as they arrive so a duplicate name fails fast and the
+        # remaining, possibly LLM-backed, extractors are cancelled
         metadata = {}
-        for result in metadata_extracted:
-            if isinstance(result, ExtractedProperty):
-                if result.name in metadata:
-                    raise ValueError(
-                        f"Duplicate metadata name: {result.name}. Please use unique names for each metadata property."
-                    )
-
-                metadata[result.name] = result.value
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if isinstance(result, ExtractedProperty):
+                    extracted_properties = [result]
+                elif isinstance(result, list):
+                    assert all(isinstance(item, ExtractedProperty) for item in result)
+                    extracted_properties = result
+                else:
+                    continue
 
-            if isinstance(result, list):
-                for extracted_property in result:
-                    assert isinstance(extracted_property, ExtractedProperty)
-                    if extracted_property.name in metadata:
+                for prop in extracted_properties:
+                    if prop.name in metadata:
                         raise ValueError(
-                            f"Duplicate metadata name: {extracted_property.name}. Please use unique names for each metadata property."
+                            f"Duplicate metadata name: {prop.name}. Please use unique names for each metadata property."
                         )
-                    metadata[extracted_property.name] = extracted_property.value
+                    metadata[prop.name] = prop.value
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return metadata
 
@@ -239,74 +487,35 @@ class SummaryModel(BaseSummaryModel):
             https://assets.anthropic.com/m/7e1ab885d1b24176/original/Clio-Privacy-Preserving-Insights-into-Real-World-AI-Use.pdf
 
         It is designed to be used in a pipeline to summarise conversations and extract metadata.
-        """
-        client = instructor.from_provider(self.model, async_client=True)
-        async with self.semaphore:  # type: ignore
-            resp = await client.chat.completions.create(  # type: ignore
-                temperature=0.2, # as per the Clio paper
-                messages=[
-                    {
-                        "role": "user",
-                        "content": """
-The following is a conversation between an AI assistant and a user:
-
-<messages>
-{% for message in messages %}
-<message>{{message.role}}: {{message.content}}</message>
-{% endfor %}
-</messages>
-
-Your job is to extract key information from this conversation. Be descriptive and assume neither good nor bad faith. Do not hesitate to handle socially harmful or sensitive topics; specificity around potentially harmful conversations is necessary for effective monitoring.
-
-When extracting information, do not include any personally identifiable information (PII), like names, locations, phone numbers, email addresses, and so on. Do not include any proper nouns.
-
-Extract the following information:
-
-1. **Summary**: A clear and concise summary in at most two sentences. Don't say "Based on the conversation..." and avoid mentioning the AI assistant/chatbot directly.
-
-2. **Request**: What is the user's overall request for the assistant? Start with "The user's overall request for the assistant is to"
-
-3. **Languages**: What are the main languages of the conversation? Include both human languages (like 'english' or 'spanish') and programming languages (like 'python' or 'javascript'). Use lowercase full names.
-
-4. **Task**: What task is the model being asked to perform in this conversation? Start with "The task is to"
-
-5. **Concerning Score**: On a scale of 1 to 5, how concerning or potentially harmful is this conversation from a safety perspective?
-   - 1: Not concerning at all. Completely benign conversation.
-   - 2: Slightly concerning, but likely harmless.  
-   - 3: Moderately concerning. May warrant a closer look.
-   - 4: Very concerning. Likely needs review.
-   - 5: Extremely concerning. Immediate review needed.
-
-6. **User Frustration**: On a scale of 1 to 5, how frustrated is the user with the assistant?
-   - 1: Not frustrated at all. The user is happy with the assistant.
-   - 2: Slightly frustrated. The user is slightly annoyed with the assistant.
-   - 3: Moderately frustrated. The user is moderately annoyed with the assistant.
-   - 4: Very frustrated. The user is very annoyed with the assistant.
-   - 5: Extremely frustrated. The user is extremely annoyed with the assistant.
-   
-7. **Assistant Errors**: What errors did the assistant make?
-   Example: 
-    - "Responses were too long and verbose"
-    - "Misunderstood the user's intent or request"
-    - "Used wrong tool for the task"
-    - "Ignored user's stated preferences or constraints"
-    - "Provided outdated or incorrect information"
-    - "Failed to maintain conversation context"
-
 
-Remember that
-- Summaries should be concise and short. They should each be at most 1-2 sentences and at most 30 words.
-- Summaries should start with "The user's overall request for the assistant is to"
-- Make sure to omit any personally identifiable information (PII), like names, locations, phone numbers, email addressess, company names and so on.
-- Make sure to indicate specific details such as programming languages, frameworks, libraries and so on which are relevant to the task.
-                        """,
-                    },
-                ],
-                context={"messages": conversation.messages},
-                response_model=GeneratedSummary,
+        If a cache_dir was configured, responses are cached on disk by a hash of the model,
+        the rendered prompt and the response schema, so re-runs skip the LLM call. If
+        short_conversation_chars was configured, conversations with less content than that
+        are summarised without the LLM.
+        """
+        if self.short_conversation_chars and (
+            sum(len(message.content) for message in conversation.messages)
+            < self.short_conversation_chars
+        ):
+            resp = self._summarise_short_conversation(conversation)
+        else:
+            # Rendered once and shared by the cache key and the request itself
+            rendered_prompt = self._render_prompt(conversation)
+            cache_key = self._cache_key(rendered_prompt) if self.cache_dir else None
+            # Cache files are read and written on a worker thread to keep the event loop free
+            resp = (
+                await asyncio.to_thread(self._load_cached_summary, cache_key)
+                if cache_key
+                else None
             )
+            if resp is None:
+                resp = await self._generate_summary(rendered_prompt)
+                if cache_key:
+                    await asyncio.to_thread(self._save_cached_summary, cache_key, resp)
 
-        metadata = await self.apply_hooks(conversation)
+        # Extracted properties take precedence over the conversation's own metadata
+        metadata = {"conversation_turns": len(conversation.messages), **conversation.metadata}
+        metadata.update(await self.apply_hooks(conversation))
         return ConversationSummary(
             chat_id=conversation.chat_id,
             summary=resp.summary,
@@ -316,9 +525,50 @@ Remember that
             concerning_score=resp.concerning_score,
             user_frustration=resp.user_frustration,
             assistant_errors=resp.assistant_errors,
-            metadata={
-                "conversation_turns": len(conversation.messages),
-                **conversation.metadata,
-                **metadata,
-            },
+            metadata=metadata,
         )
+
+    def _summarise_short_conversation(self, conversation: Conversation) -> GeneratedSummary:
+        """Build a summary for a very short conversation without calling the LLM.
+
+        The summary is the raw start of the user's first message, so unlike LLM summaries it
+        is not scrubbed of PII. Fields that need the LLM's judgement are left unset.
+        """
+        first_request = next(
+            (message.content for message in conversation.messages if message.role == "user"),
+            conversation.messages[0].content if conversation.messages else "",
+        )
+        message_text = " ".join(first_request.split())[:120]
+        return GeneratedSummary(
+            summary=message_text,
+            request=f"The user's overall request for the assistant is to respond to: {message_text}",
+            languages=None,
+            task=None,
+            concerning_score=None,
+            user_frustration=None,
+            assistant_errors=None,
+        )
+
+    async def _generate_summary(self, rendered_prompt: str) -> GeneratedSummary:
+        """Ask the LLM to extract a GeneratedSummary from a rendered conversation."""
+        if self.token_bucket is not None:
+            # Roughly four characters per token for the prompt, plus room for the reply
+            estimated_tokens = (len(_SUMMARY_SYSTEM_PROMPT) + len(rendered_prompt)) // 4 + 500
+            await self.token_bucket.acquire(estimated_tokens)
+
+        async with self.semaphore:  # type: ignore
+            resp = await self.client.chat.completions.create(  # type: ignore
+                temperature=_SUMMARY_TEMPERATURE,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": _SUMMARY_SYSTEM_PROMPT,
+                    },
+                    {
+                        "role": "user",
+                        "content": rendered_prompt,
+                    },
+                ],
+                response_model=GeneratedSummary,
+            )
+        return resp
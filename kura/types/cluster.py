@@ -1,11 +1,15 @@
-from pydantic import BaseModel, Field, computed_field
-import uuid
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+import os
+from dataclasses import dataclass
 from typing import Union
 
 
 class Cluster(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     id: str = Field(
-        default_factory=lambda: uuid.uuid4().hex,
+        # Same 32 hex characters as uuid4().hex without building a UUID object
+        default_factory=lambda: os.urandom(16).hex(),
     )
     name: str
     description: str
@@ -13,6 +17,7 @@ class Cluster(BaseModel):
     parent_id: Union[str, None]
 
     @computed_field
+    @property
     def count(self) -> int:
         return len(self.chat_ids)
 
@@ -22,7 +27,12 @@ class GeneratedCluster(BaseModel):
     summary: str = Field(..., description="A clear, precise, two-sentence description in past tense that captures the essence of the clustered statements and distinguishes them from contrastive examples. Should be specific to this group without including PII or proper nouns")
 
 
-class ClusterTreeNode(BaseModel):
+@dataclass(frozen=True)
+class ClusterTreeNode:
+    # Built in bulk by the visualizer and never validated or serialised, so a slotted
+    # dataclass avoids the per-instance dict and pydantic validation of a BaseModel
+    __slots__ = ("id", "name", "description", "count", "children")
+
     id: str
     name: str
     description: str
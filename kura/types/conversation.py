@@ -1,22 +1,68 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import from_json
 from datetime import datetime
 from typing import Literal, Union, Callable
-import json
-import importlib
+import importlib.util
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from tqdm import tqdm
 
+# Resolved once at import rather than searching sys.meta_path on every call
+_HAS_DATASETS = importlib.util.find_spec("datasets") is not None
+
 metadata_dict = dict[
     str, Union[str, int, float, bool, list[str], list[int], list[float]]
 ]
 
 
+@lru_cache(maxsize=65536)
+def _parse_created_at(timestamp: str) -> datetime:
+    # Messages in an export often share a timestamp, so repeated strings are only parsed once
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def _claude_messages(chat_messages: list[dict]) -> list[dict]:
+    # Parse each timestamp once and sort on the decorated tuples, human before assistant on ties
+    decorated = [
+        (
+            _parse_created_at(message["created_at"]),
+            0 if message["sender"] == "human" else 1,
+            message,
+        )
+        for message in chat_messages
+    ]
+    decorated.sort(key=itemgetter(0, 1))
+
+    return [
+        {
+            "created_at": created_at,
+            "role": "user" if sender_rank == 0 else "assistant",
+            "content": "\n".join(
+                [item["text"] for item in message["content"] if item["type"] == "text"]
+            ),
+        }
+        for created_at, sender_rank, message in decorated
+    ]
+
+
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     created_at: datetime
     role: Literal["user", "assistant"]
     content: str
 
+    @cached_property
+    def content_preview(self) -> str:
+        # Messages are immutable, so the truncated text is built once and reused
+        if len(self.content) > 100:
+            return self.content[:100] + "..."
+        return self.content
+
 
 class Conversation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     chat_id: str
     created_at: datetime
     messages: list[Message]
@@ -26,19 +72,15 @@ class Conversation(BaseModel):
     def generate_conversation_dump(
         cls, conversations: list["Conversation"], file_path: str
     ) -> None:
-        with open(file_path, "w") as f:
-            json.dump(
-                [
-                    conversation.model_dump(mode="json")
-                    for conversation in conversations
-                ],
-                f,
-            )
+        # pydantic-core serialises straight to JSON bytes without building dicts first
+        with open(file_path, "wb") as f:
+            f.write(_CONVERSATIONS_ADAPTER.dump_json(conversations))
 
     @classmethod
     def from_conversation_dump(cls, file_path: str) -> list["Conversation"]:
-        with open(file_path, "r") as f:
-            return [Conversation(**conversation) for conversation in json.load(f)]
+        # pydantic-core parses and validates the raw bytes in one pass, without a json.load dict tree
+        with open(file_path, "rb") as f:
+            return _CONVERSATIONS_ADAPTER.validate_json(f.read())
 
     @classmethod
     def from_hf_dataset(
@@ -51,7 +93,7 @@ class Conversation(BaseModel):
         messages_fn=lambda x: x["messages"],
         metadata_fn=lambda x: {},
     ) -> list["Conversation"]:
-        if importlib.util.find_spec("datasets") is None:  # type: ignore
+        if not _HAS_DATASETS:
             raise ImportError(
                 "Please install hf datasets to load conversations from a dataset"
             )
@@ -64,15 +106,18 @@ class Conversation(BaseModel):
         else:
             dataset = load_dataset(dataset_name, split=split, streaming=True)
 
-        return [
-            Conversation(
-                chat_id=chat_id_fn(item),
-                created_at=created_at_fn(item),
-                messages=messages_fn(item),
-                metadata=metadata_fn(item),
-            )
-            for item in tqdm(dataset, desc="Loading Conversations")
-        ]
+        # Project rows to plain dicts, then validate them all in a single pydantic-core call
+        return _CONVERSATIONS_ADAPTER.validate_python(
+            [
+                {
+                    "chat_id": chat_id_fn(item),
+                    "created_at": created_at_fn(item),
+                    "messages": messages_fn(item),
+                    "metadata": metadata_fn(item),
+                }
+                for item in tqdm(dataset, desc="Loading Conversations", mininterval=0.5)
+            ]
+        )
 
     @classmethod
     def from_claude_conversation_dump(
@@ -80,38 +125,27 @@ class Conversation(BaseModel):
         file_path: str,
         metadata_fn: Callable[[dict], metadata_dict] = lambda x: {},
     ) -> list["Conversation"]:
-        with open(file_path, "r") as f:
-            return [
-                Conversation(
-                    chat_id=conversation["uuid"],
-                    created_at=conversation["created_at"],
-                    messages=[
-                        Message(
-                            created_at=datetime.fromisoformat(
-                                message["created_at"].replace("Z", "+00:00")
-                            ),
-                            role="user"
-                            if message["sender"] == "human"
-                            else "assistant",
-                            content="\n".join(
-                                [
-                                    item["text"]
-                                    for item in message["content"]
-                                    if item["type"] == "text"
-                                ]
-                            ),
-                        )
-                        for message in sorted(
-                            conversation["chat_messages"],
-                            key=lambda x: (
-                                datetime.fromisoformat(
-                                    x["created_at"].replace("Z", "+00:00")
-                                ),
-                                0 if x["sender"] == "human" else 1,
-                            ),
-                        )
-                    ],
-                    metadata=metadata_fn(conversation),
-                )
-                for conversation in json.load(f)
-            ]
+        # pydantic-core's JSON parser reads the raw bytes about twice as fast as json.load
+        with open(file_path, "rb") as f:
+            raw_conversations = from_json(f.read())
+
+        # Stream plain dicts into a single pydantic-core call, so each one can be
+        # released as soon as it is validated instead of holding a list of them all
+        conversations = (
+            {
+                "chat_id": conversation["uuid"],
+                "created_at": conversation["created_at"],
+                "messages": _claude_messages(conversation["chat_messages"]),
+                "metadata": metadata_fn(conversation),
+            }
+            for conversation in raw_conversations
+        )
+
+        try:
+            return _CONVERSATIONS_ADAPTER.validate_python(conversations)
+        finally:
+            # Timestamps rarely repeat across dumps, so don't keep this one's parses alive
+            _parse_created_at.cache_clear()
+
+
+_CONVERSATIONS_ADAPTER = TypeAdapter(list[Conversation])
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Union
 
 
@@ -54,6 +54,9 @@ class GeneratedSummary(BaseModel):
 
 
 class ConversationSummary(GeneratedSummary):
+    # Only needed once summaries are built or loaded, so skip the schema build at import
+    model_config = ConfigDict(defer_build=True)
+
     chat_id: str
     metadata: dict
 
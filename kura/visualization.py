@@ -5,7 +5,9 @@ in the terminal, including basic tree views, enhanced visualizations with statis
 and rich-formatted output using the Rich library when available.
 """
 
-from typing import TYPE_CHECKING
+import io
+import os
+from typing import TYPE_CHECKING, Optional
 from kura.types import Cluster, ClusterTreeNode
 
 # Try to import Rich, fall back gracefully if not available
@@ -44,6 +46,8 @@ class ClusterVisualizer:
         self.kura = kura_instance
         self.console = kura_instance.console
         self.meta_cluster_model = kura_instance.meta_cluster_model
+        # Checkpoint clusters keyed by (path, mtime) so switching views skips a re-read
+        self._checkpoint_cache: dict[tuple[str, float], list[Cluster]] = {}
     
     def _build_tree_structure(
         self,
@@ -55,7 +59,9 @@ class ClusterVisualizer:
     ) -> str:
         """Build a text representation of the hierarchical cluster tree.
         
-        This is a recursive helper method used by visualise_clusters().
+        This is a helper method used by visualise_clusters(). The tree is walked
+        iteratively with an explicit stack and written to a single buffer, so
+        large hierarchies avoid both deep recursion and repeated string copies.
         
         Args:
             node: Current tree node
@@ -67,45 +73,110 @@ class ClusterVisualizer:
         Returns:
             String representation of the tree structure
         """
-        # Current line prefix (used for tree visualization symbols)
-        current_prefix = prefix
-
-        # Add the appropriate connector based on whether this is the last child
-        if level > 0:
-            if is_last:
-                current_prefix += "╚══ "
-            else:
-                current_prefix += "╠══ "
+        output = io.StringIO()
+        stack = [(node, level, is_last, prefix)]
+
+        while stack:
+            current, current_level, current_is_last, current_prefix = stack.pop()
+
+            # Add the appropriate connector based on whether this is the last child
+            connector = ""
+            child_prefix = current_prefix
+            if current_level > 0:
+                if current_is_last:
+                    connector = "╚══ "
+                    child_prefix += "    "  # No vertical line needed for last child's children
+                else:
+                    connector = "╠══ "
+                    child_prefix += "║   "  # Continue vertical line for non-last child's children
+
+            output.write(
+                f"{current_prefix}{connector}{current.name} ({current.count} conversations)\n"
+            )
 
-        # Print the current node
-        result = (
-            current_prefix + node.name + " (" + str(node.count) + " conversations)\n"
-        )
+            # Push children in reverse so the first child is written first
+            children = current.children
+            for i in range(len(children) - 1, -1, -1):
+                stack.append(
+                    (
+                        node_id_to_cluster[children[i]],
+                        current_level + 1,
+                        i == len(children) - 1,
+                        child_prefix,
+                    )
+                )
+
+        return output.getvalue()
+
+    def _build_node_index(
+        self, clusters: list[Cluster]
+    ) -> tuple[dict[str, ClusterTreeNode], list[ClusterTreeNode]]:
+        """Index clusters as tree nodes and collect the root nodes in a single pass.
+        
+        Children that appear in the list before their parent are held until the
+        parent node is created, so the input does not need to be ordered.
+        
+        Args:
+            clusters: Flat list of clusters loaded from the meta-cluster checkpoint
+            
+        Returns:
+            Tuple of (mapping of node IDs to nodes, root nodes in input order)
+        """
+        node_id_to_cluster: dict[str, ClusterTreeNode] = {}
+        pending_children: dict[str, list[str]] = {}
+        root_nodes: list[ClusterTreeNode] = []
+
+        for cluster in clusters:
+            node = ClusterTreeNode(
+                id=cluster.id,
+                name=cluster.name,
+                description=cluster.description,
+                count=len(cluster.chat_ids),  # Access the actual count value
+                children=pending_children.pop(cluster.id, []),
+            )
+            node_id_to_cluster[cluster.id] = node
 
-        # Calculate the prefix for children (continue vertical lines for non-last children)
-        child_prefix = prefix
-        if level > 0:
-            if is_last:
-                child_prefix += "    "  # No vertical line needed for last child's children
+            if not cluster.parent_id:
+                root_nodes.append(node)
+            elif cluster.parent_id in node_id_to_cluster:
+                node_id_to_cluster[cluster.parent_id].children.append(cluster.id)
             else:
-                child_prefix += "║   "  # Continue vertical line for non-last child's children
-
-        # Process children
-        children = node.children
-        for i, child_id in enumerate(children):
-            child = node_id_to_cluster[child_id]
-            is_last_child = i == len(children) - 1
-            result += self._build_tree_structure(
-                child, node_id_to_cluster, level + 1, is_last_child, child_prefix
-            )
+                pending_children.setdefault(cluster.parent_id, []).append(cluster.id)
 
-        return result
+        return node_id_to_cluster, root_nodes
 
-    def visualise_clusters(self):
+    def _resolve_clusters(self, clusters: Optional[list[Cluster]]) -> list[Cluster]:
+        """Return the clusters to visualise, reading the checkpoint only as a last resort.
+        
+        Args:
+            clusters: Clusters passed in by the caller, if any
+            
+        Returns:
+            The given clusters, else the meta-clusters Kura last produced,
+            else the contents of the meta-cluster checkpoint file
+        """
+        if clusters is not None:
+            return clusters
+
+        if self.kura._last_meta_clusters is not None:
+            return self.kura._last_meta_clusters
+
+        checkpoint_path = self.kura.meta_cluster_checkpoint_path
+        key = (checkpoint_path, os.stat(checkpoint_path).st_mtime)
+        if key not in self._checkpoint_cache:
+            # Hand pydantic-core the raw bytes so lines are not decoded to str first
+            validate_line = Cluster.model_validate_json
+            with open(checkpoint_path, "rb") as f:
+                # Only the latest version of the file is worth keeping
+                self._checkpoint_cache = {key: [validate_line(line) for line in f]}
+        return self._checkpoint_cache[key]
+
+    def visualise_clusters(self, clusters: Optional[list[Cluster]] = None):
         """Print a hierarchical visualization of clusters to the terminal.
         
-        This method loads clusters from the meta_cluster_checkpoint file,
-        builds a tree representation, and prints it to the console.
+        This method uses the given clusters, or the meta-clusters from the last
+        run, falling back to the meta_cluster_checkpoint file. It builds a tree
+        representation and prints it to the console.
         The visualization shows the hierarchical relationship between clusters
         with indentation and tree structure symbols.
         
@@ -115,30 +186,16 @@ class ClusterVisualizer:
         ║       ╠══ Improve React TypeScript application (15 conversations)
         ║       ╚══ Compare and select Flutter state management solutions (17 conversations)
         ╠══ Optimize blog posts for SEO and improved user engagement (28 conversations)
+        
+        Args:
+            clusters: Optional clusters to visualise instead of the last results
         """
-        with open(self.kura.meta_cluster_checkpoint_path) as f:
-            clusters = [Cluster.model_validate_json(line) for line in f]
-
-        node_id_to_cluster = {}
-
-        for node in clusters:
-            node_id_to_cluster[node.id] = ClusterTreeNode(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                count=len(node.chat_ids),  # Access the actual count value
-                children=[],
-            )
+        clusters = self._resolve_clusters(clusters)
 
-        for node in clusters:
-            if node.parent_id:
-                node_id_to_cluster[node.parent_id].children.append(node.id)
+        node_id_to_cluster, root_nodes = self._build_node_index(clusters)
 
-        # Find root nodes and build the tree
+        # Build the tree from the root nodes
         tree_output = ""
-        root_nodes = [
-            node_id_to_cluster[node.id] for node in clusters if not node.parent_id
-        ]
 
         fake_root = ClusterTreeNode(
             id="root",
@@ -165,6 +222,9 @@ class ClusterVisualizer:
     ) -> str:
         """Build an enhanced text representation with colors and better formatting.
         
+        Like _build_tree_structure(), the tree is walked iteratively and each
+        node's prefixes are built once and shared with its children.
+        
         Args:
             node: Current tree node
             node_id_to_cluster: Dictionary mapping node IDs to nodes
@@ -176,90 +236,74 @@ class ClusterVisualizer:
         Returns:
             String representation of the enhanced tree structure
         """
-        # Color scheme based on level
-        colors = ["bright_cyan", "bright_green", "bright_yellow", "bright_magenta", "bright_blue"]
-        colors[level % len(colors)]
-        
-        # Current line prefix (used for tree visualization symbols)
-        current_prefix = prefix
+        output = io.StringIO()
+        stack = [(node, level, is_last, prefix)]
+
+        while stack:
+            current, current_level, current_is_last, current_prefix = stack.pop()
+
+            # Work out the connector, detail-line indent and child prefix once per node
+            connector = ""
+            detail_prefix = current_prefix + "    "
+            child_prefix = current_prefix
+            if current_level > 0:
+                if current_is_last:
+                    connector = "╚══ "
+                    child_prefix += "    "
+                else:
+                    connector = "╠══ "
+                    detail_prefix = current_prefix + "║   "
+                    child_prefix += "║   "
+
+            # Calculate percentage of total conversations
+            percentage = (current.count / total_conversations * 100) if total_conversations > 0 else 0
+
+            # Create progress bar for visual representation
+            bar_width = 20
+            filled_width = int((current.count / total_conversations) * bar_width) if total_conversations > 0 else 0
+            progress_bar = "█" * filled_width + "░" * (bar_width - filled_width)
 
-        # Add the appropriate connector based on whether this is the last child
-        if level > 0:
-            if is_last:
-                current_prefix += "╚══ "
-            else:
-                current_prefix += "╠══ "
+            # Build the lines with enhanced formatting
+            output.write(f"{current_prefix}{connector}🔸 {current.name}\n")
+            output.write(f"{detail_prefix}📊 {current.count:,} conversations ({percentage:.1f}%) [{progress_bar}]\n")
 
-        # Calculate percentage of total conversations
-        percentage = (node.count / total_conversations * 100) if total_conversations > 0 else 0
-        
-        # Create progress bar for visual representation
-        bar_width = 20
-        filled_width = int((node.count / total_conversations) * bar_width) if total_conversations > 0 else 0
-        progress_bar = "█" * filled_width + "░" * (bar_width - filled_width)
-        
-        # Build the line with enhanced formatting
-        result = f"{current_prefix}🔸 {node.name}\n"
-        result += f"{prefix}{'║   ' if not is_last and level > 0 else '    '}📊 {node.count:,} conversations ({percentage:.1f}%) [{progress_bar}]\n"
-        
-        # Add description if available and not too long
-        if hasattr(node, 'description') and node.description and len(node.description) < 100:
-            result += f"{prefix}{'║   ' if not is_last and level > 0 else '    '}💭 {node.description}\n"
-        
-        result += "\n"
+            # Add description if available and not too long
+            if current.description and len(current.description) < 100:
+                output.write(f"{detail_prefix}💭 {current.description}\n")
 
-        # Calculate the prefix for children
-        child_prefix = prefix
-        if level > 0:
-            if is_last:
-                child_prefix += "    "
-            else:
-                child_prefix += "║   "
-
-        # Process children
-        children = node.children
-        for i, child_id in enumerate(children):
-            child = node_id_to_cluster[child_id]
-            is_last_child = i == len(children) - 1
-            result += self._build_enhanced_tree_structure(
-                child, node_id_to_cluster, level + 1, is_last_child, child_prefix, total_conversations
-            )
+            output.write("\n")
 
-        return result
+            # Push children in reverse so the first child is written first
+            children = current.children
+            for i in range(len(children) - 1, -1, -1):
+                stack.append(
+                    (
+                        node_id_to_cluster[children[i]],
+                        current_level + 1,
+                        i == len(children) - 1,
+                        child_prefix,
+                    )
+                )
 
-    def visualise_clusters_enhanced(self):
+        return output.getvalue()
+
+    def visualise_clusters_enhanced(self, clusters: Optional[list[Cluster]] = None):
         """Print an enhanced hierarchical visualization of clusters with colors and statistics.
         
         This method provides a more detailed visualization than visualise_clusters(),
         including conversation counts, percentages, progress bars, and descriptions.
+        
+        Args:
+            clusters: Optional clusters to visualise instead of the last results
         """
         print("\n" + "="*80)
         print("🎯 ENHANCED CLUSTER VISUALIZATION")
         print("="*80)
         
-        with open(self.meta_cluster_checkpoint_path) as f:
-            clusters = [Cluster.model_validate_json(line) for line in f]
-
-        node_id_to_cluster = {}
-        total_conversations = sum(len(node.chat_ids) for node in clusters if not node.parent_id)
-
-        for node in clusters:
-            node_id_to_cluster[node.id] = ClusterTreeNode(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                count=len(node.chat_ids),  # Access the actual count value
-                children=[],
-            )
+        clusters = self._resolve_clusters(clusters)
 
-        for node in clusters:
-            if node.parent_id:
-                node_id_to_cluster[node.parent_id].children.append(node.id)
-
-        # Find root nodes and build the tree
-        root_nodes = [
-            node_id_to_cluster[node.id] for node in clusters if not node.parent_id
-        ]
+        node_id_to_cluster, root_nodes = self._build_node_index(clusters)
+        total_conversations = sum(node.count for node in root_nodes)
 
         fake_root = ClusterTreeNode(
             id="root",
@@ -285,42 +329,31 @@ class ClusterVisualizer:
         print(f"📏 Average Conversations per Root Cluster: {total_conversations/len(root_nodes):.1f}")
         print("="*80 + "\n")
 
-    def visualise_clusters_rich(self):
+    def visualise_clusters_rich(self, clusters: Optional[list[Cluster]] = None):
         """Print a rich-formatted hierarchical visualization using Rich library.
         
         This method provides the most visually appealing output with colors, 
         interactive-style formatting, and comprehensive statistics when Rich is available.
         Falls back to enhanced visualization if Rich is not available.
+        
+        Args:
+            clusters: Optional clusters to visualise instead of the last results
         """
         if not RICH_AVAILABLE or not self.console:
             print("⚠️  Rich library not available or console disabled. Using enhanced visualization...")
-            self.visualise_clusters_enhanced()
+            self.visualise_clusters_enhanced(clusters)
             return
 
-        with open(self.kura.meta_cluster_checkpoint_path) as f:
-            clusters = [Cluster.model_validate_json(line) for line in f]
+        clusters = self._resolve_clusters(clusters)
 
         # Build cluster tree structure
-        node_id_to_cluster = {}
-        total_conversations = sum(len(node.chat_ids) for node in clusters if not node.parent_id)
-
-        for node in clusters:
-            node_id_to_cluster[node.id] = ClusterTreeNode(
-                id=node.id,
-                name=node.name,
-                description=node.description,
-                count=len(node.chat_ids),  # Access the actual count value
-                children=[],
-            )
-
-        for node in clusters:
-            if node.parent_id:
-                node_id_to_cluster[node.parent_id].children.append(node.id)
+        node_id_to_cluster, root_nodes = self._build_node_index(clusters)
+        total_conversations = sum(node.count for node in root_nodes)
 
         # Create Rich Tree
         if Tree is None:
             print("⚠️  Rich Tree component not available. Using enhanced visualization...")
-            self.visualise_clusters_enhanced()
+            self.visualise_clusters_enhanced(clusters)
             return
             
         tree = Tree(
@@ -328,11 +361,6 @@ class ClusterVisualizer:
             style="bold bright_cyan"
         )
 
-        # Add root clusters to tree
-        root_nodes = [
-            node_id_to_cluster[node.id] for node in clusters if not node.parent_id
-        ]
-
         def add_node_to_tree(rich_tree, cluster_node, level=0):
             """Recursively add nodes to Rich tree with formatting."""
             # Color scheme based on level
@@ -0,0 +1,167 @@
+import asyncio
+
+from kura import Kura
+from kura.types import Cluster, ConversationSummary, ProjectedCluster
+
+
+def test_checkpoint_round_trip(tmp_path):
+    """Test that saved checkpoints load back into equal models"""
+    kura = Kura(checkpoint_dir=str(tmp_path), disable_progress=True)
+    path = str(tmp_path / "clusters.jsonl")
+    clusters = [
+        Cluster(
+            name="Debug Python code",
+            description="Fix errors",
+            chat_ids=["1", "2"],
+            parent_id=None,
+        ),
+        Cluster(
+            name="Write SQL queries",
+            description="Join tables",
+            chat_ids=["3"],
+            parent_id="abc",
+        ),
+    ]
+
+    kura.save_checkpoint(path, clusters)
+
+    assert kura.load_checkpoint(path, Cluster) == clusters
+
+
+def test_checkpoint_round_trip_summaries(tmp_path):
+    """Test that summaries keep their optional fields and metadata"""
+    kura = Kura(checkpoint_dir=str(tmp_path), disable_progress=True)
+    path = str(tmp_path / "summaries.jsonl")
+    summaries = [
+        ConversationSummary(
+            chat_id="1",
+            summary="The user asked for help with pandas.",
+            languages=["english", "python"],
+            concerning_score=1,
+            metadata={"conversation_turns": 4, "model": "gpt-4o"},
+        ),
+        ConversationSummary(chat_id="2", summary="The user wrote a poem.", metadata={}),
+    ]
+
+    kura.save_checkpoint(path, summaries)
+
+    assert kura.load_checkpoint(path, ConversationSummary) == summaries
+
+
+def test_checkpoint_round_trip_projected_clusters(tmp_path):
+    """Test that subclass fields are written out"""
+    kura = Kura(checkpoint_dir=str(tmp_path), disable_progress=True)
+    path = str(tmp_path / "dimensionality.jsonl")
+    clusters = [
+        ProjectedCluster(
+            name="Debug Python code",
+            description="Fix errors",
+            chat_ids=["1"],
+            parent_id=None,
+            x_coord=0.5,
+            y_coord=-1.25,
+            level=0,
+        )
+    ]
+
+    kura.save_checkpoint(path, clusters)
+
+    assert kura.load_checkpoint(path, ProjectedCluster) == clusters
+
+
+def test_missing_checkpoint_returns_none(tmp_path):
+    """Test that a missing checkpoint file is treated as no checkpoint"""
+    kura = Kura(checkpoint_dir=str(tmp_path), disable_progress=True)
+
+    assert kura.load_checkpoint(str(tmp_path / "missing.jsonl"), Cluster) is None
+
+
+def test_checkpoint_paths_follow_checkpoint_dir(tmp_path):
+    """Test that changing checkpoint_dir after construction moves the checkpoints"""
+    kura = Kura(checkpoint_dir=str(tmp_path / "first"), disable_progress=True)
+    assert kura.meta_cluster_checkpoint_path.startswith(str(tmp_path / "first"))
+
+    kura.checkpoint_dir = str(tmp_path / "second")
+
+    assert kura.meta_cluster_checkpoint_path.startswith(str(tmp_path / "second"))
+
+
+def test_pipeline_writes_every_stage_checkpoint(tmp_path):
+    """Test that every stage checkpoint is on disk when the pipeline returns"""
+    cluster = Cluster(
+        name="Debug Python code",
+        description="Fix errors",
+        chat_ids=["1"],
+        parent_id=None,
+    )
+    projected = ProjectedCluster(
+        **cluster.model_dump(), x_coord=0.0, y_coord=0.0, level=0
+    )
+
+    class Stage:
+        max_clusters = 10
+
+        def __init__(self, filename, result):
+            self.checkpoint_filename = filename
+            self.result = result
+
+        async def run(self, items):
+            await asyncio.sleep(0)
+            return self.result
+
+        summarise = cluster_summaries = reduce_clusters = reduce_dimensionality = run
+
+    summary = ConversationSummary(
+        chat_id="1", summary="The user fixed a bug.", metadata={}
+    )
+    kura = Kura(
+        embedding_model=object(),
+        summarisation_model=Stage("summaries.jsonl", [summary]),
+        cluster_model=Stage("clusters.jsonl", [cluster]),
+        meta_cluster_model=Stage("meta_clusters.jsonl", [cluster]),
+        dimensionality_reduction=Stage("dimensionality.jsonl", [projected]),
+        checkpoint_dir=str(tmp_path),
+        disable_progress=True,
+    )
+
+    result = asyncio.run(kura.cluster_conversations([]))
+
+    assert result == [projected]
+    assert kura.load_checkpoint(kura.summary_checkpoint_path, ConversationSummary) == [
+        summary
+    ]
+    assert kura.load_checkpoint(kura.cluster_checkpoint_path, Cluster) == [cluster]
+    assert kura.load_checkpoint(kura.meta_cluster_checkpoint_path, Cluster) == [cluster]
+    assert kura.load_checkpoint(
+        kura.dimensionality_checkpoint_path, ProjectedCluster
+    ) == [projected]
+
+
+def test_stage_checkpoint_is_written_before_it_returns(tmp_path):
+    """Test that calling a stage directly leaves its checkpoint complete on disk"""
+    cluster = Cluster(
+        name="Debug Python code",
+        description="Fix errors",
+        chat_ids=["1"],
+        parent_id=None,
+    )
+
+    class ClusterStage:
+        checkpoint_filename = "clusters.jsonl"
+
+        async def cluster_summaries(self, summaries):
+            return [cluster]
+
+    kura = Kura(
+        embedding_model=object(),
+        cluster_model=ClusterStage(),
+        checkpoint_dir=str(tmp_path),
+        disable_progress=True,
+    )
+
+    async def run():
+        await kura.generate_base_clusters([])
+        # Read back before yielding to the event loop again
+        return kura.load_checkpoint(kura.cluster_checkpoint_path, Cluster)
+
+    assert asyncio.run(run()) == [cluster]
@@ -0,0 +1,17 @@
+from kura.types import Cluster
+
+
+def test_count_follows_model_copy():
+    """Test that count reflects chat_ids after a model_copy update"""
+    cluster = Cluster(
+        name="Debug Python code",
+        description="Fix errors",
+        chat_ids=["1", "2"],
+        parent_id=None,
+    )
+    assert cluster.count == 2
+
+    copied = cluster.model_copy(update={"chat_ids": ["1"]})
+
+    assert copied.count == 1
+    assert copied.model_dump()["count"] == 1
@@ -0,0 +1,247 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from kura.summarisation import SummaryModel, _TokenBucket
+from kura.types import Conversation, ConversationSummary, ExtractedProperty, Message
+from kura.types.summarisation import GeneratedSummary
+
+
+def make_conversation(chat_id: str, content: str) -> Conversation:
+    return Conversation(
+        chat_id=chat_id,
+        created_at=datetime(2024, 1, 1),
+        messages=[
+            Message(created_at=datetime(2024, 1, 1), role="user", content=content),
+        ],
+        metadata={},
+    )
+
+
+def test_cached_summary_skips_llm_call(tmp_path):
+    """Test that a cached response is used instead of calling the LLM"""
+    model = SummaryModel(cache_dir=str(tmp_path))
+    conversation = make_conversation("1", "How do I reverse a list in python?")
+    cached = GeneratedSummary(
+        summary="The user asked how to reverse a list.",
+        request="The user's overall request for the assistant is to reverse a list",
+        languages=["english", "python"],
+        task="The task is to reverse a list",
+        concerning_score=1,
+        user_frustration=1,
+        assistant_errors=[],
+    )
+    model._save_cached_summary(
+        model._cache_key(model._render_prompt(conversation)), cached
+    )
+
+    async def fail(rendered_prompt):
+        raise AssertionError("LLM should not be called on a cache hit")
+
+    model._generate_summary = fail
+
+    summary = asyncio.run(model.summarise_conversation(conversation))
+
+    assert summary.chat_id == "1"
+    assert summary.summary == cached.summary
+    assert summary.languages == ["english", "python"]
+    assert summary.metadata == {"conversation_turns": 1}
+
+
+def test_cache_miss_saves_response_for_next_run(tmp_path):
+    """Test that a generated response is written to the cache and reused"""
+    model = SummaryModel(cache_dir=str(tmp_path))
+    conversation = make_conversation("1", "Explain recursion")
+    calls = []
+
+    async def generate(rendered_prompt):
+        calls.append(rendered_prompt)
+        return GeneratedSummary(summary="The user asked about recursion.")
+
+    model._generate_summary = generate
+
+    first = asyncio.run(model.summarise_conversation(conversation))
+    second = asyncio.run(model.summarise_conversation(conversation))
+
+    assert len(calls) == 1
+    assert first.summary == second.summary == "The user asked about recursion."
+
+
+def test_concurrent_cache_writes_to_one_key(tmp_path):
+    """Test that writers saving the same key at once neither fail nor leave temp files"""
+    model = SummaryModel(cache_dir=str(tmp_path))
+    resp = GeneratedSummary(summary="The user asked for a haiku.")
+
+    errors = []
+
+    def save_many():
+        for _ in range(200):
+            try:
+                model._save_cached_summary("same-key", resp)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=save_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert model._load_cached_summary("same-key") == resp
+    assert os.listdir(tmp_path) == ["same-key.json"]
+
+
+def test_cache_dir_is_created_on_first_save(tmp_path):
+    """Test that the cache directory is only created once a response is saved"""
+    cache_dir = tmp_path / "summaries"
+    model = SummaryModel(cache_dir=str(cache_dir))
+
+    assert not cache_dir.exists()
+
+    model._save_cached_summary("key", GeneratedSummary(summary="The user said hello."))
+
+    assert os.listdir(cache_dir) == ["key.json"]
+
+
+def test_cache_key_depends_on_messages():
+    """Test that identical messages share a cache key and different ones don't"""
+    model = SummaryModel()
+
+    first = make_conversation("1", "Write a haiku")
+    same = make_conversation("2", "Write a haiku")
+    different = make_conversation("3", "Write a limerick")
+
+    def key(conversation):
+        return model._cache_key(model._render_prompt(conversation))
+
+    assert key(first) == key(same)
+    assert key(first) != key(different)
+
+
+def test_summarise_iter_bounds_in_flight_conversations():
+    """Test that summarise_iter yields every summary with a bounded window"""
+    model = SummaryModel()
+    in_flight = 0
+    peak = 0
+
+    async def fake_summarise(conversation):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return ConversationSummary(
+            chat_id=conversation.chat_id, summary="s", metadata={}
+        )
+
+    model.summarise_conversation = fake_summarise
+    conversations = [make_conversation(str(i), "hi") for i in range(20)]
+
+    async def collect():
+        return [
+            summary async for summary in model.summarise_iter(conversations, window=4)
+        ]
+
+    summaries = asyncio.run(collect())
+
+    assert sorted(summary.chat_id for summary in summaries) == sorted(
+        str(i) for i in range(20)
+    )
+    assert peak <= 4
+
+
+def test_apply_hooks_rejects_duplicate_names():
+    """Test that two extractors reporting the same property name raise an error"""
+
+    async def language(conversation, sem):
+        return ExtractedProperty(name="language", value="english")
+
+    async def languages(conversation, sem):
+        return [
+            ExtractedProperty(name="turns", value=1),
+            ExtractedProperty(name="language", value="french"),
+        ]
+
+    model = SummaryModel(extractors=[language, languages])
+
+    with pytest.raises(ValueError, match="Duplicate metadata name: language"):
+        asyncio.run(model.apply_hooks(make_conversation("1", "Bonjour")))
+
+
+def test_token_bucket_waits_for_refill():
+    """Test that the token bucket delays requests once the budget is spent"""
+    now = 0.0
+    delays = []
+
+    def clock():
+        return now
+
+    async def sleep(delay):
+        nonlocal now
+        delays.append(delay)
+        now += delay
+
+    # 600 tokens per minute refills at 10 tokens per second
+    bucket = _TokenBucket(tokens_per_minute=600, clock=clock, sleep=sleep)
+
+    async def spend():
+        await bucket.acquire(600)
+        await bucket.acquire(3)
+
+    asyncio.run(spend())
+
+    assert delays == [pytest.approx(0.3)]
+
+
+def test_apply_hooks_cancels_remaining_extractors_on_duplicate():
+    """Test that a duplicate name stops extractors that are still running"""
+    finished = []
+
+    async def first(conversation, sem):
+        return ExtractedProperty(name="language", value="english")
+
+    async def second(conversation, sem):
+        await asyncio.sleep(0.01)
+        return ExtractedProperty(name="language", value="french")
+
+    async def slow(conversation, sem):
+        await asyncio.sleep(1)
+        finished.append(True)
+        return ExtractedProperty(name="sentiment", value="positive")
+
+    model = SummaryModel(extractors=[first, second, slow])
+
+    async def run():
+        with pytest.raises(ValueError, match="Duplicate metadata name: language"):
+            await model.apply_hooks(make_conversation("1", "Bonjour"))
+        await asyncio.sleep(0)
+
+    start = time.monotonic()
+    asyncio.run(run())
+
+    assert time.monotonic() - start < 0.5
+    assert finished == []
+
+
+def test_short_conversations_skip_llm_when_enabled():
+    """Test that conversations under the threshold are summarised without the LLM"""
+    model = SummaryModel(short_conversation_chars=50)
+
+    async def fail(rendered_prompt):
+        raise AssertionError("LLM should not be called for short conversations")
+
+    model._generate_summary = fail
+
+    summary = asyncio.run(
+        model.summarise_conversation(make_conversation("1", "Write a haiku"))
+    )
+
+    assert summary.chat_id == "1"
+    assert summary.summary == "Write a haiku"
+    assert summary.request.endswith("Write a haiku")
+    assert summary.concerning_score is None
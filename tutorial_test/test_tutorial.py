@@ -3,13 +3,21 @@ import asyncio
 from contextlib import contextmanager
 from rich.console import Console
 
+# Use uvloop's faster event loop if it is installed, fall back to asyncio's otherwise
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 @contextmanager
 def timer(description: str):
     """Context manager that times an operation."""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     yield
-    elapsed = time.perf_counter() - start
+    elapsed = (time.perf_counter_ns() - start) / 1e9
     print(f"[COMPLETED] {description}: {elapsed:.2f}s")
 
 def show_welcome():
@@ -63,18 +71,15 @@ print(f"Loaded {len(conversations)} conversations successfully!\n")
 show_section_header("Saving Conversations")
 
 with timer("Saving conversations to JSON"):
-    import json
     import os
     
     # Ensure checkpoint directory exists
     os.makedirs("./tutorial_checkpoints", exist_ok=True)
     
-    # Convert conversations to JSON format
-    conversations_data = [conv.model_dump() for conv in conversations]
-    
     # Save to conversations.json
-    with open("./tutorial_checkpoints/conversations.json", "w") as f:
-        json.dump(conversations_data, f, indent=2, default=str)
+    Conversation.generate_conversation_dump(
+        conversations, "./tutorial_checkpoints/conversations.json"
+    )
     
 print(f"Saved {len(conversations)} conversations to tutorial_checkpoints/conversations.json\n")
 
@@ -93,8 +98,7 @@ print()
 # Sample messages
 print("Sample Messages:")
 for i, msg in enumerate(sample_conversation.messages[:3]):
-    content_preview = msg.content[:100] + "..." if len(msg.content) > 100 else msg.content
-    print(f"  {msg.role}: {content_preview}")
+    print(f"  {msg.role}: {msg.content_preview}")
 
 print()
 
@@ -7,6 +7,14 @@ import asyncio
 import os
 import subprocess
 
+# Use uvloop's faster event loop if it is installed, fall back to asyncio's otherwise
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Create and configure Kura instance
 kura = Kura(
     checkpoint_dir="./tutorial_checkpoints",
@@ -39,11 +47,7 @@ print(f"Created at: {sample_conversation.created_at}")
 print(f"Number of messages: {len(sample_conversation.messages)}")
 print("\nSample messages:")
 for i, msg in enumerate(sample_conversation.messages[:3]):
-    print(
-        f"{msg.role}: {msg.content[:100]}..."
-        if len(msg.content) > 100
-        else f"{msg.role}: {msg.content}"
-    )
+    print(f"{msg.role}: {msg.content_preview}")
 
 # Process conversations
 clustered_data = asyncio.run(kura.cluster_conversations(conversations))